@@ -5,15 +5,19 @@ from .library import (
     linearithmic_time,
     quadratic_time,
     exponential_time_safe,
-    factorial_time
+    factorial_time,
+    load_compiled,
+    COMPILED_BACKEND,
+    INTERPRETER
 )
 
-ALGORITHMS = {
-    "1": ("O(1)", constant_time),
-    "2": ("O(log n)", logarithmic_time),
-    "3": ("O(n)", linear_time),
-    "4": ("O(n log n)", linearithmic_time),
-    "5": ("O(n^2)", quadratic_time),
-    "6": ("O(2^n)", exponential_time_safe),
-    "7": ("O(n!)", factorial_time)
-}
+# Ordered (name, func) pairs; the UI selects them by index.
+ALGORITHMS = (
+    ("O(1)", constant_time),
+    ("O(log n)", logarithmic_time),
+    ("O(n)", linear_time),
+    ("O(n log n)", linearithmic_time),
+    ("O(n^2)", quadratic_time),
+    ("O(2^n)", exponential_time_safe),
+    ("O(n!)", factorial_time),
+)
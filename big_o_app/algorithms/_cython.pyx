@@ -0,0 +1,40 @@
+# cython: language_level=3
+# Cython build of the _pure counting kernels: C integer loops, compiled ahead of
+# time, so unlike _numba.py there's no JIT warm-up. Optional; build in place with
+#   cythonize -i big_o_app/algorithms/_cython.pyx
+# and library.py prefers it over Numba.
+
+cpdef long long constant_kernel(long long n):
+    return n + 1
+
+# Same checksum-mixing loops as _pure.py: a bare count += 1 loop is folded by
+# the C compiler into a formula, which would make every curve flat.
+
+cpdef long long logarithmic_kernel(long long n):
+    cdef long long acc = 0
+    while n > 1:
+        n //= 2
+        acc = (acc * 31 + n) & 0xFFFFFFFF
+    return acc
+
+cpdef long long linear_kernel(long long n):
+    cdef long long i, acc = 0
+    for i in range(n):
+        acc = (acc * 31 + i) & 0xFFFFFFFF
+    return acc
+
+cpdef long long linearithmic_kernel(long long n):
+    cdef long long i, temp, acc = 0
+    for i in range(n):
+        temp = n
+        while temp > 1:
+            temp //= 2
+            acc = (acc * 31 + temp) & 0xFFFFFFFF
+    return acc
+
+cpdef long long quadratic_kernel(long long n):
+    cdef long long i, j, acc = 0
+    for i in range(n):
+        for j in range(n):
+            acc = (acc * 31 + i + j) & 0xFFFFFFFF
+    return acc
@@ -0,0 +1,18 @@
+# Numba-compiled twins of the _pure kernels (CPython only).
+# Importing this module raises ImportError when numba is not installed.
+from numba import njit
+
+from . import _pure
+
+def _compile(kernel):
+    """
+    Compiles kernel for int64 -> int64.
+    The explicit signature compiles at import, so JIT latency never lands in a timing.
+    """
+    return njit("int64(int64)", cache=True)(kernel)
+
+constant_kernel = _compile(_pure.constant_kernel)
+logarithmic_kernel = _compile(_pure.logarithmic_kernel)
+linear_kernel = _compile(_pure.linear_kernel)
+linearithmic_kernel = _compile(_pure.linearithmic_kernel)
+quadratic_kernel = _compile(_pure.quadratic_kernel)
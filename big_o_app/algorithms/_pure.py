@@ -0,0 +1,36 @@
+# Pure-Python counting kernels. These are what PyPy's tracing JIT compiles,
+# and the source the Numba twins in _numba.py are built from.
+
+def constant_kernel(n): return n + 1
+
+# Each step mixes into a running checksum instead of doing count += 1: compilers
+# turn a bare counting loop into a formula (n, n*n, ...), which would make the
+# Numba/Cython curves flat. The multiply carries a dependency from one step to
+# the next, so the loop has to run. The mask keeps acc a small int in Python.
+
+def logarithmic_kernel(n):
+    acc = 0
+    while n > 1:
+        n //= 2
+        acc = (acc * 31 + n) & 0xFFFFFFFF
+    return acc
+
+def linear_kernel(n):
+    acc = 0
+    for i in range(n): acc = (acc * 31 + i) & 0xFFFFFFFF
+    return acc
+
+def linearithmic_kernel(n):
+    acc = 0
+    for i in range(n):
+        temp = n
+        while temp > 1:
+            temp //= 2
+            acc = (acc * 31 + temp) & 0xFFFFFFFF
+    return acc
+
+def quadratic_kernel(n):
+    acc = 0
+    for i in range(n):
+        for j in range(n): acc = (acc * 31 + i + j) & 0xFFFFFFFF
+    return acc
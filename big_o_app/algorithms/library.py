@@ -1,51 +1,89 @@
+import importlib
+import importlib.util
 import itertools
+import math
+import platform
+from collections import deque
 from ..config import AppState, MAX_SAFE_N_2POW, MAX_SAFE_N_FACT
 
-def constant_time(n): return n + 1
+from . import _pure
+
+# Compiled kernels come from the Cython extension if it was built, else Numba.
+# Both only target CPython; under PyPy the tracing JIT already compiles the
+# _pure loops, so they're used as-is. Only availability is checked at import:
+# loading _numba compiles (or reads back) every kernel, so that waits for
+# load_compiled().
+INTERPRETER = platform.python_implementation()
+_compiled = None
+COMPILED_BACKEND = None # "cython" | "numba" | None
+if INTERPRETER == "CPython":
+    if importlib.util.find_spec(f"{__package__}._cython") is not None:
+        COMPILED_BACKEND = "cython"
+    elif importlib.util.find_spec("numba") is not None:
+        COMPILED_BACKEND = "numba"
+
+def load_compiled():
+    """Imports the compiled backend on first call and returns it. Raises ImportError if there is none."""
+    global _compiled
+    if _compiled is None:
+        if COMPILED_BACKEND is None:
+            raise ImportError("No compiled backend: build the Cython extension or install numba.")
+        _compiled = importlib.import_module(f"._{COMPILED_BACKEND}", __package__)
+    return _compiled
+
+# In AppState.fast_mode each kernel returns its count in closed form instead of
+# counting it out, so the measured time no longer reflects the complexity class.
+#
+# None of these are memoized: measure_time repeats fast calls to average them,
+# and a cached kernel would time the cache lookup instead. Repeated (func, n)
+# measurements are cached one level up, in engine.timer.
+
+# --- Public algorithms ---
+
+def constant_time(n):
+    if AppState.jit_enabled: return (_compiled or load_compiled()).constant_kernel(n)
+    return _pure.constant_kernel(n)
 
 def logarithmic_time(n):
-    count = 0
-    while n > 1:
-        n //= 2
-        count += 1
-    return count
+    if AppState.fast_mode: return max(0, n.bit_length() - 1)
+    if AppState.jit_enabled: return (_compiled or load_compiled()).logarithmic_kernel(n)
+    return _pure.logarithmic_kernel(n)
 
 def linear_time(n):
-    count = 0
-    for i in range(n): count += 1
-    return count
+    if AppState.fast_mode: return n
+    if AppState.jit_enabled: return (_compiled or load_compiled()).linear_kernel(n)
+    return _pure.linear_kernel(n)
 
 def linearithmic_time(n):
-    count = 0
-    limit = n
-    for i in range(n):
-        temp = limit
-        while temp > 1:
-            temp //= 2
-            count += 1
-    return count
+    if AppState.fast_mode: return n * max(0, n.bit_length() - 1)
+    if AppState.jit_enabled: return (_compiled or load_compiled()).linearithmic_kernel(n)
+    return _pure.linearithmic_kernel(n)
 
 def quadratic_time(n):
-    count = 0
-    for i in range(n):
-        for j in range(n): count += 1
-    return count
+    if AppState.fast_mode: return n * n
+    if AppState.jit_enabled: return (_compiled or load_compiled()).quadratic_kernel(n)
+    return _pure.quadratic_kernel(n)
+
+# The two below touch AppState/itertools and stay pure Python.
 
 def exponential_time_safe(n):
     if AppState.safety_enabled and n > MAX_SAFE_N_2POW:
         raise ValueError(f"Safety limit (N={MAX_SAFE_N_2POW}) exceeded for O(2^n).")
     
-    count = 0
     target = 2**n 
     if target > 100_000_000: return 0 
-    for i in range(target): count += 1
-    return count
+    if AppState.fast_mode: return target
+    # Still O(2^n) steps, but drained at C speed by a zero-length deque
+    deque(range(target), maxlen=0)
+    return target
 
 def factorial_time(n):
     if AppState.safety_enabled and n > MAX_SAFE_N_FACT:
          raise ValueError(f"Safety limit (N={MAX_SAFE_N_FACT}) exceeded for O(n!).")
+    # Counting mode: n! in O(n) C code. Demonstration mode (below) really
+    # enumerates every permutation so the O(n!) wall-clock is observable.
+    if AppState.fast_mode: return math.factorial(n)
     
-    count = 0
-    for p in itertools.permutations(range(n)):
-        count += 1
-    return count
+    # Consume the iterator in C: still O(n!) wall-clock, no per-item bytecode
+    deque(itertools.permutations(range(n)), maxlen=0)
+    return math.factorial(n)
@@ -9,6 +9,18 @@ class AppState:
     safety_enabled = True
     mode = "TEACHING" # TEACHING | CHAOS
     delay = 0.1       # Seconds to sleep between steps in Teaching mode
+    fast_mode = False # Closed-form kernels: instant results, but flat curves
+    jit_enabled = False # Compiled (Cython/Numba) kernels
+
+    @classmethod
+    def snapshot(cls):
+        """Returns the settings the kernels read, e.g. to seed worker processes."""
+        return {"safety_enabled": cls.safety_enabled, "fast_mode": cls.fast_mode, "jit_enabled": cls.jit_enabled}
+
+    @classmethod
+    def restore(cls, state):
+        for key, value in state.items():
+            setattr(cls, key, value)
 
 EXPLANATIONS = {
     "O(1)": "Constant Time: The operation takes the same amount of time regardless of input size. Gold standard.",
@@ -1,16 +1,44 @@
 import time
+from functools import lru_cache
+
+from ..config import AppState
+
+MIN_SAMPLE_NS = 1_000_000  # Calls faster than this are repeated and averaged
+MAX_REPEATS = 1_000_000
+
+@lru_cache(maxsize=4096)
+def _timed(func, n, variant):
+    """
+    Times func(n) in seconds. Cached per (func, n, variant); exceptions are
+    never cached, so safety-limited calls are re-checked every time.
+    variant only keys the cache, so toggling fast/JIT mode forces a re-measure.
+    """
+    start = time.perf_counter_ns()
+    func(n)
+    elapsed = time.perf_counter_ns() - start
+    if elapsed >= MIN_SAMPLE_NS:
+        return elapsed * 1e-9
+    
+    # Below timer resolution territory (O(1), O(log n)): repeat until the batch
+    # spans about MIN_SAMPLE_NS, like timeit.autorange, and report the mean.
+    repeats = min(MAX_REPEATS, MIN_SAMPLE_NS // max(elapsed, 1))
+    start = time.perf_counter_ns()
+    for _ in range(repeats):
+        func(n)
+    return (time.perf_counter_ns() - start) / repeats * 1e-9
 
 def measure_time(func, n):
     """
     Executes func(n) and returns duration in seconds.
+    Repeated (func, n) pairs return the cached duration; see measure_time.cache_clear().
     """
     try:
-        start = time.perf_counter()
-        func(n)
-        return time.perf_counter() - start
+        return _timed(func, n, (AppState.fast_mode, AppState.jit_enabled))
     except ValueError:
         return None # Caught safety error
     except RecursionError:
         return None
     except KeyboardInterrupt:
         return None
+
+measure_time.cache_clear = _timed.cache_clear
@@ -2,15 +2,39 @@ from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import Label, SelectionList, Button, Input, Log, TabbedContent, TabPane, Static, RadioButton, RadioSet, Switch, Header
 from textual_plotext import PlotextPlot
-from rich.table import Table
 import asyncio
+import os
+import multiprocessing
+import numpy as np
 
 from ..config import EXPLANATIONS, AppState
-from ..algorithms import ALGORITHMS
+from ..algorithms import ALGORITHMS, COMPILED_BACKEND, INTERPRETER, load_compiled
 from ..engine.timer import measure_time
 from .viz import plot_external
 from .screens import IntroScreen
 
+def _init_worker(state):
+    """Pool initializer: mirror the UI's settings, loading compiled kernels before any timing."""
+    AppState.restore(state)
+    if AppState.jit_enabled:
+        load_compiled()
+
+def _pool_measure(pool, loop, func, n):
+    """Runs measure_time(func, n) in a multiprocessing pool and returns an awaitable for it."""
+    future = loop.create_future()
+    
+    def resolve(setter, value):
+        # The future may already be cancelled by an abort; drop late results
+        if not future.done():
+            setter(value)
+    
+    pool.apply_async(
+        measure_time, (func, n),
+        callback=lambda t: loop.call_soon_threadsafe(resolve, future.set_result, t),
+        error_callback=lambda e: loop.call_soon_threadsafe(resolve, future.set_exception, e),
+    )
+    return future
+
 class BigOTUI(App):
     """
     Main Application class for the Big O Visualizer.
@@ -39,9 +63,35 @@ class BigOTUI(App):
     last_algorithms = []
     last_range = None
     worker = None # Track current worker
+    _last_raw_range = None   # Input strings behind _last_valid_range
+    _last_valid_range = None
 
     def on_mount(self) -> None:
         """Called when the app is mounted."""
+        # Resolve every widget the handlers touch once, before the intro screen
+        # becomes the active DOM (query_one searches the current screen only).
+        self._widgets = {
+            "log": self.query_one("#log-widget", Log),
+            "plot": self.query_one("#plot-widget", PlotextPlot),
+            "run_btn": self.query_one("#run-btn", Button),
+            "abort_btn": self.query_one("#abort-btn", Button),
+            "start_n": self.query_one("#start-n", Input),
+            "end_n": self.query_one("#end-n", Input),
+            "step_n": self.query_one("#step-n", Input),
+            "algo_list": self.query_one("#algo-list", SelectionList),
+            "mode_teaching": self.query_one("#mode-teaching", RadioButton),
+            "mode_line": self.query_one("#mode-line", RadioButton),
+            "safety_label": self.query_one("#safety-label", Label),
+            "header": self.query_one("#header", Header),
+        }
+        self._err_state = {}  # Widget key -> whether it currently has the .error class
+        
+        log = self._widgets["log"]
+        log.write_line(f"Interpreter: {INTERPRETER} (compiled kernels: {COMPILED_BACKEND or 'none'})")
+        if INTERPRETER == "PyPy":
+            log.write_line("PyPy detected: its tracing JIT compiles the counting loops natively.")
+        elif COMPILED_BACKEND is None:
+            log.write_line("Tip: `pip install numba` (or building the Cython kernels) enables the compiled-kernels switch, or run under PyPy.")
         self.push_screen(IntroScreen())
 
     def compose(self) -> ComposeResult:
@@ -56,9 +106,9 @@ class BigOTUI(App):
             yield Label("Configuration")
             
             selections = []
-            for key, (name, _) in ALGORITHMS.items():
-                initial_state = (key in ["3", "5"])
-                selections.append((name, key, initial_state))
+            for index, (name, _) in enumerate(ALGORITHMS):
+                initial_state = (index in (2, 4)) # O(n), O(n^2)
+                selections.append((name, index, initial_state))
             
             yield Label("Select Algorithms:")
             yield SelectionList(*selections, id="algo-list")
@@ -73,12 +123,19 @@ class BigOTUI(App):
                 yield RadioButton("Line Plot", value=True, id="mode-line")
                 yield RadioButton("Scatter Plot", id="mode-scatter")
             
+            yield Label("Fast Mode (closed form):")
+            yield Switch(value=AppState.fast_mode, id="fast-switch", tooltip="Return counts via arithmetic (e.g. math.factorial) instead of doing the work. Curves go flat.")
+            
+            yield Label("Compiled Kernels (Cython/Numba):")
+            yield Switch(value=AppState.jit_enabled, id="jit-switch", disabled=COMPILED_BACKEND is None, tooltip="Run the counting loops as machine code. Requires the Cython build or numba.")
+            
             # Simplified Safety Display (controlled by Mode)
             yield Label("Safety: ON (Teaching)", id="safety-label")
 
             yield Button("Run Comparison", variant="primary", id="run-btn", tooltip="Start the visualization.")
             yield Button("Abort Test", variant="warning", id="abort-btn", disabled=True, tooltip="Emergency stop.")
             yield Button("Open in Matplotlib", id="ext-btn", tooltip="View high-res chart in external window.")
+            yield Button("Reset Cache", id="cache-btn", tooltip="Forget cached timings and re-measure on the next run.")
             yield Button("Quit", variant="error", id="quit-btn")
 
         with Container(id="main-content"):
@@ -109,17 +166,20 @@ class BigOTUI(App):
             self.run_comparison()
         elif event.button.id == "ext-btn":
             self.open_external_plot()
+        elif event.button.id == "cache-btn":
+            measure_time.cache_clear()
+            self.notify("Timing cache cleared.")
         elif event.button.id == "abort-btn":
             if self.worker:
                 self.worker.cancel()
-                self.query_one("#log-widget", Log).write_line("[!] Aborting...")
+                self._widgets["log"].write_line("[!] Aborting...")
 
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         if event.radio_set.id == "mode-selector":
-            safety_label = self.query_one("#safety-label", Label)
-            header = self.query_one("#header", Header)
+            safety_label = self._widgets["safety_label"]
+            header = self._widgets["header"]
             
-            if self.query_one("#mode-teaching", RadioButton).value:
+            if self._widgets["mode_teaching"].value:
                 # Teaching Mode
                 AppState.mode = "TEACHING"
                 AppState.safety_enabled = True
@@ -140,40 +200,48 @@ class BigOTUI(App):
                 
                 self.notify("WARNING: Chaos Mode enabled. Limits removed.", severity="warning", timeout=5)
 
+    def on_switch_changed(self, event: Switch.Changed) -> None:
+        if event.switch.id == "jit-switch":
+            if event.value:
+                # First use imports the backend (Numba compiles or reads its cache),
+                # so that cost is paid here rather than inside a measurement
+                try:
+                    load_compiled()
+                except ImportError as e:
+                    self._widgets["log"].write_line(f"[!] Compiled kernels unavailable: {e}")
+                    event.switch.value = False
+                    return
+            AppState.jit_enabled = event.value
+        elif event.switch.id == "fast-switch":
+            AppState.fast_mode = event.value
+
     def validate_inputs(self):
+        widgets = self._widgets
+        raw = (widgets["start_n"].value, widgets["end_n"].value, widgets["step_n"].value)
+        
+        # Unchanged since the last valid run (and nothing flagged): reuse the parse.
+        if raw == self._last_raw_range and not any(self._err_state.values()):
+            return self._last_valid_range
+        
         try:
-            start_inp = self.query_one("#start-n", Input)
-            end_inp = self.query_one("#end-n", Input)
-            step_inp = self.query_one("#step-n", Input)
-            
-            start_n = int(start_inp.value)
-            end_n = int(end_inp.value)
-            step_n = int(step_inp.value)
-            
-            valid = True
-            if start_n < 1: 
-                start_inp.add_class("error")
-                valid = False
-            else: start_inp.remove_class("error")
-                
-            if end_n <= start_n:
-                end_inp.add_class("error")
-                valid = False
-            else: end_inp.remove_class("error")
-                
-            if step_n < 1:
-                step_inp.add_class("error")
-                valid = False
-            else: step_inp.remove_class("error")
-                
-            if not valid: return None
-            return (start_n, end_n, step_n)
-            
+            start_n, end_n, step_n = (int(v) for v in raw)
         except ValueError:
             return None
+        
+        errors = {"start_n": start_n < 1, "end_n": end_n <= start_n, "step_n": step_n < 1}
+        for key, failed in errors.items():
+            # Only touch the DOM when a field's error state actually flips
+            if failed != self._err_state.get(key, False):
+                widgets[key].set_class(failed, "error")
+                self._err_state[key] = failed
+        
+        if any(errors.values()): return None
+        self._last_raw_range = raw
+        self._last_valid_range = (start_n, end_n, step_n)
+        return self._last_valid_range
 
     def run_comparison(self):
-        log = self.query_one("#log-widget", Log)
+        log = self._widgets["log"]
         
         vals = self.validate_inputs()
         if not vals:
@@ -181,13 +249,13 @@ class BigOTUI(App):
             return
             
         start_n, end_n, step_n = vals
-        selected_keys = self.query_one("#algo-list", SelectionList).selected
+        selected_keys = self._widgets["algo_list"].selected
         if not selected_keys:
             self.notify("Select at least one algorithm!", severity="warning")
             return
             
         selected_algs = [ALGORITHMS[k] for k in selected_keys]
-        plot_type = "line" if self.query_one("#mode-line", RadioButton).value else "scatter"
+        plot_type = "line" if self._widgets["mode_line"].value else "scatter"
         
         log.write_line(f"Starting: Mode={AppState.mode}")
         
@@ -195,54 +263,70 @@ class BigOTUI(App):
         self.last_algorithms = selected_algs
         
         # UI State update
-        self.query_one("#run-btn").disabled = True
-        self.query_one("#abort-btn").disabled = False
+        self._widgets["run_btn"].disabled = True
+        self._widgets["abort_btn"].disabled = False
         
         self.worker = self.run_worker(self.compute_and_plot(selected_algs, self.last_range, plot_type), exclusive=True)
 
     async def compute_and_plot(self, algorithms, n_range, plot_type):
-        plot_widget = self.query_one("#plot-widget", PlotextPlot)
-        log = self.query_one("#log-widget", Log)
+        plot_widget = self._widgets["plot"]
+        log = self._widgets["log"]
         
+        # The plot is cleared once here and drawn once after the loop;
+        # nothing inside the per-N loop touches plotext.
         plot_widget.plt.clear_data()
         plot_widget.plt.title(f"Complexity ({plot_type.title()})")
         
-        x_axis = []
-        # Structure for live updates: {alg_name: [times...]}
-        # We need to build lists incrementally
-        results = {name: [] for name, _ in algorithms}
+        x_axis = np.fromiter(n_range, dtype=np.int64)
+        # One preallocated row per algorithm: {alg_name: float64[len(n_range)]}
+        # NaN marks points that were skipped (safety limit) or never reached.
+        results = {name: np.full(len(x_axis), np.nan) for name, _ in algorithms}
+        
+        # Chaos mode measures in worker processes: points run in parallel
+        # and off the event loop's GIL, so the UI stays responsive.
+        pool = None
+        if AppState.mode == "CHAOS":
+            # multiprocessing.Pool rather than ProcessPoolExecutor: only Pool can
+            # terminate() a worker stuck mid-measurement (e.g. O(n!) on Abort)
+            pool = multiprocessing.Pool(
+                processes=min(len(x_axis), os.cpu_count() or 1),
+                initializer=_init_worker,
+                initargs=(AppState.snapshot(),),
+            )
+        loop = asyncio.get_running_loop()
         
         try:
-            for n in n_range:
-                # Check cancellation
-                # In Textual workers, cancellation raises CancelledError at await points, 
-                # but we are doing CPU blocking work in measure_time. 
-                # We should yield control regularly.
-                
-                x_axis.append(n)
-                
+            if pool is not None:
+                # Algorithm-major order: each algorithm sweeps the whole range in one
+                # burst, so its bytecode (or compiled kernel) stays hot in the workers.
                 for name, func in algorithms:
-                    t = measure_time(func, n)
-                    results[name].append(t)
-                
-                # --- LIVE UPDATE OR DELAY ---
-                if AppState.delay > 0:
-                    # Teaching mode: Simulate "thinking" or emphasis
+                    row = results[name]
+                    times = await asyncio.gather(
+                        *(_pool_measure(pool, loop, func, n) for n in n_range)
+                    )
+                    for i, t in enumerate(times):
+                        if t is not None:
+                            row[i] = t
+            else:
+                # Teaching mode steps through N: every algorithm is measured at one N,
+                # then a single pause (which also yields to the UI) and log line.
+                for i, n in enumerate(n_range):
+                    for name, func in algorithms:
+                        t = measure_time(func, n)
+                        if t is not None:
+                            results[name][i] = t
+                    
                     await asyncio.sleep(AppState.delay)
                     log.write_line(f"Processed N={n}...")
-                    
-                # Yield to UI loop (allows Abort button click to be processed)
-                await asyncio.sleep(0.01)
 
-            # Final Plot
+            # Final Plot: one plt call per algorithm
             for name, times in results.items():
-                clean_times = [t if t is not None else 0 for t in times]
+                clean_times = np.nan_to_num(times)
                 if plot_type == "line":
                     plot_widget.plt.plot(x_axis, clean_times, label=name)
                 else:
                     plot_widget.plt.scatter(x_axis, clean_times, label=name)
             
-            self.last_results = results
             self.last_results = results
             plot_widget.refresh()
             
@@ -257,29 +341,41 @@ class BigOTUI(App):
             self.notify("Test Aborted")
             
         finally:
-            self.query_one("#run-btn").disabled = False
-            self.query_one("#abort-btn").disabled = True
+            if pool is not None:
+                # Kills workers still measuring; after a full run there are none left
+                pool.terminate()
+            self._widgets["run_btn"].disabled = False
+            self._widgets["abort_btn"].disabled = True
             self.worker = None
 
     def print_summary_table(self, log_widget, results, count):
-        """Generates and prints a summary table to the log."""
+        """Generates the summary table and writes it to the log in a single call."""
         if count == 0: return
+        # Only needed once per completed run
+        from rich.console import Console
+        from rich.table import Table
+
+        # Format every cell up front so rendering is pure layout
+        rows = []
+        for name, times in results.items():
+             # Skipped points are NaN; mask them once and reduce the survivors
+             valid_times = times[~np.isnan(times)]
+             if valid_times.size == 0:
+                 rows.append((name, "N/A", "N/A"))
+                 continue
+                 
+             rows.append((name, f"{valid_times.max():.6f}", f"{valid_times.mean():.6f}"))
 
         table = Table(title="Performance Summary")
         table.add_column("Algorithm", style="cyan")
         table.add_column("Max Time (s)", justify="right")
         table.add_column("Avg Time (s)", justify="right")
+        for row in rows:
+            table.add_row(*row)
         
-        for name, times in results.items():
-             # Filter Nones
-             valid_times = [t for t in times if t is not None]
-             if not valid_times:
-                 table.add_row(name, "N/A", "N/A")
-                 continue
-                 
-             max_t = max(valid_times)
-             avg_t = sum(valid_times) / len(valid_times)
-             
-             table.add_row(name, f"{max_t:.6f}", f"{avg_t:.6f}")
-        
-        log_widget.write(table)
+        # Log is line-based and only takes text: render the table once, off-screen,
+        # and hand the whole block over in one write.
+        console = Console(width=max(log_widget.size.width, 40), color_system=None)
+        with console.capture() as capture:
+            console.print(table)
+        log_widget.write(capture.get())
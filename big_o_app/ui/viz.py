@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-
 def plot_external(algorithms, n_range, results):
     """
     Opens a standard Matplotlib window with the given results.
@@ -9,6 +7,10 @@ def plot_external(algorithms, n_range, results):
     results: Dictionary { algorithm_name: [times...] }
     """
     try:
+        # Imported lazily: pyplot's backend and font-cache setup costs
+        # hundreds of ms, which the TUI shouldn't pay at startup.
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
         x = list(n_range)
         
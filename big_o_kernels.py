@@ -0,0 +1,64 @@
+# ==========================================
+#  BIG O KERNELS - counting loops for big_o_sandbox
+# ==========================================
+#
+#  Plain-Python loops, shared by the sandbox's Python mode and its JIT mode.
+#  numba is only imported inside compile_kernels(), so importing this module
+#  costs nothing; compiled code is cached on disk (cache=True), so only the
+#  first compile on a machine pays for LLVM.
+#
+# ==========================================
+
+# Each step mixes into a running checksum (acc) instead of doing count += 1:
+# LLVM rewrites a bare counting loop as a formula (n, n*n, ...), which would
+# make every compiled curve flat. The multiply carries a dependency from one
+# step to the next, so the loop can't be collapsed or vectorized away.
+CHECKSUM_MASK = 0xFFFFFFFF # Keeps acc a small int in Python, no overflow in int64
+
+def logarithmic_kernel(n):
+    acc = 0
+    while n > 1:
+        n //= 2
+        acc = (acc * 31 + n) & CHECKSUM_MASK
+    return acc
+
+def linear_kernel(n):
+    acc = 0
+    for i in range(n): acc = (acc * 31 + i) & CHECKSUM_MASK
+    return acc
+
+def linearithmic_kernel(n):
+    acc = 0
+    for i in range(n):
+        temp = n
+        while temp > 1:
+            temp //= 2
+            acc = (acc * 31 + temp) & CHECKSUM_MASK
+    return acc
+
+def quadratic_kernel(n):
+    acc = 0
+    for i in range(n):
+        for j in range(n): acc = (acc * 31 + i + j) & CHECKSUM_MASK
+    return acc
+
+_compiled = None
+
+def compile_kernels():
+    """
+    Returns {"logarithmic": ..., "linear": ..., ...} of Numba-compiled kernels,
+    compiling (or loading from the disk cache) on first call.
+    Raises ImportError if numba is not installed.
+    """
+    global _compiled
+    if _compiled is None:
+        from numba import njit
+        # Explicit signature: compile now, not on the first (timed) call
+        compile_kernel = njit("int64(int64)", cache=True)
+        _compiled = {
+            "logarithmic": compile_kernel(logarithmic_kernel),
+            "linear": compile_kernel(linear_kernel),
+            "linearithmic": compile_kernel(linearithmic_kernel),
+            "quadratic": compile_kernel(quadratic_kernel),
+        }
+    return _compiled
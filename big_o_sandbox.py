@@ -4,6 +4,11 @@ import random
 import math
 import itertools
 import os
+import timeit
+import functools
+import importlib.util
+
+import big_o_kernels
 
 # Try to import curses
 try:
@@ -12,6 +17,23 @@ try:
 except ImportError:
     CURSES_AVAILABLE = False
 
+# PyPy's tracing JIT already compiles the pure-Python kernels. numba doesn't run
+# there, and numpy calls go through a slow C-API emulation, so both are skipped.
+IS_PYPY = sys.implementation.name == "pypy"
+
+# Try to import numpy (optional vectorized O(n^2) work)
+NUMPY_AVAILABLE = False
+if not IS_PYPY:
+    try:
+        import numpy as np
+        NUMPY_AVAILABLE = True
+    except ImportError:
+        pass
+
+# numba is optional and only imported when JIT mode is first switched on
+USE_JIT = not IS_PYPY
+NUMBA_AVAILABLE = USE_JIT and importlib.util.find_spec("numba") is not None
+
 # ==========================================
 #  BIG O SANDBOX - EDUCATIONAL TOOL V2
 # ==========================================
@@ -22,6 +44,7 @@ except ImportError:
 #  - Step-Through Mode (Pause & Analyze)
 #  - ASCII & Curses Visualization
 #  - Safety Rails for Exponential/Factorial
+#  - Optional Numba JIT Kernels
 #
 # ==========================================
 
@@ -41,11 +64,20 @@ def custom_user_function(n):
 
 # ==========================================
 
-CONFIG = {
-    "safety_enabled": True,
-    "max_safe_n_2pow": 30, # Safe limit for O(2^n) if safety is on
-    "max_safe_n_fact": 10, # Safe limit for O(n!) if safety is on
-}
+# Settings are plain module globals: the kernels read them on every call, and a
+# global int/bool load is cheaper than a string-keyed dict lookup
+SAFETY_ENABLED = True
+MAX_SAFE_N_2POW = 30 # Safe limit for O(2^n) if safety is on
+MAX_SAFE_N_FACT = 11 # Safe limit for O(n!) if safety is on (~0.2s per call)
+JIT_ENABLED = False  # Use the Numba-compiled kernels (see toggle_jit)
+SIMULATE_WORK = True # False: O(log n)..O(n^2) return their count by arithmetic
+SIMULATE_FACTORIAL_WORK = True # False: O(n!) returns math.factorial(n) without stepping
+PRECISE_TIMING = False # --precise: pure kernels use timeit's autorange (>= 0.2 s per reading)
+
+def toggle_safety():
+    global SAFETY_ENABLED
+    SAFETY_ENABLED = not SAFETY_ENABLED
+    print(f"\n>> Safety is now {'ON' if SAFETY_ENABLED else 'OFF'}.")
 
 EXPLANATIONS = {
     "O(1)": "Constant Time: The operation takes the same amount of time regardless of input size. Gold standard.",
@@ -59,49 +91,74 @@ EXPLANATIONS = {
 
 # --- ALGORITHMS ---
 
+# Kernels that are deterministic and side-effect free, so measure_time may
+# rerun them as often as timeit wants (see measure_time)
+PURE_KERNELS = set()
+
+def pure(func):
+    PURE_KERNELS.add(func)
+    return func
+
+@pure
 def constant_time(n): return n + 1
+@pure
 def logarithmic_time(n):
+    if not SIMULATE_WORK: return max(0, int(n).bit_length() - 1) # semantic-preserving
     count = 0
     while n > 1:
         n //= 2
         count += 1
     return count
+@pure
 def linear_time(n):
-    count = 0
-    for i in range(n): count += 1
-    return count
+    if not SIMULATE_WORK: return n # semantic-preserving
+    # Still n steps, but the counting loop runs inside sum() in C
+    return sum(itertools.repeat(1, n))
+# Below this N, numpy's per-call overhead outweighs the loop it replaces
+NUMPY_MIN_N = 64
+QUADRATIC_TILE_BYTES = 1 << 20 # Keeps the O(n^2) pass at ~1 MB of memory
+
+@pure
 def linearithmic_time(n):
-    count = 0
-    limit = n
-    for i in range(n):
-        temp = limit
-        while temp > 1:
-            temp //= 2
-            count += 1
-    return count
+    if not SIMULATE_WORK: return n * max(0, n.bit_length() - 1) # semantic-preserving
+    # Plain loop on purpose: a numpy version pays ~log n fixed-cost calls per
+    # invocation, which swamp the n-sized work and flatten the fitted slope to ~0.4
+    return big_o_kernels.linearithmic_kernel(n)
+@pure
 def quadratic_time(n):
+    if not SIMULATE_WORK: return n * n # semantic-preserving
+    if not NUMPY_AVAILABLE or n < NUMPY_MIN_N:
+        count = 0
+        for _ in itertools.repeat(None, n): count += sum(itertools.repeat(1, n))
+        return count
+    # Touch all n*n cells, a tile of rows at a time, instead of one n x n array
+    rows_per_tile = min(n, max(1, QUADRATIC_TILE_BYTES // n))
+    tile = np.ones((rows_per_tile, n), dtype=np.int8)
     count = 0
-    for i in range(n):
-        for j in range(n): count += 1
+    for start in range(0, n, rows_per_tile):
+        count += int(tile[:min(rows_per_tile, n - start)].sum())
     return count
-def exponential_time_safe(n): # Helper to simulate work without stack depth issues
-    if CONFIG["safety_enabled"] and n > CONFIG["max_safe_n_2pow"]:
-        raise ValueError(f"Safety limits prevent running O(2^n) with N={n}. Max safe N is {CONFIG['max_safe_n_2pow']}.")
-    count = 0
+def _exponential_target(n):
+    """
+    Safety-checks n and returns how far O(2^n) should count (0 past the hard cap).
+    Kept in Python so the JIT twin can share it: a jitted body can't read these globals.
+    """
+    if SAFETY_ENABLED and n > MAX_SAFE_N_2POW:
+        raise ValueError(f"Safety limits prevent running O(2^n) with N={n}. Max safe N is {MAX_SAFE_N_2POW}.")
     target = 2**n 
     # Hard cap to prevent freezing even if safety is somehow bypassed or high
     if target > 100_000_000: return 0 
-    for i in range(target): count += 1
-    return count
+    return target
+def exponential_time_safe(n): # Helper to simulate work without stack depth issues
+    return linear_time(_exponential_target(n))
 def factorial_time(n):
-    if CONFIG["safety_enabled"] and n > CONFIG["max_safe_n_fact"]:
-         raise ValueError(f"Safety limits prevent running O(n!) with N={n}. Max safe N is {CONFIG['max_safe_n_fact']}.")
-    count = 0
-    # Simulated work: permutations grow as n!
-    # We use a smaller loop to simulate the 'cost' if n is huge, but for n<=12 actual perms is fine
-    # For instructional honesty, we run actual perms if small, else error
-    for p in itertools.permutations(range(n)):
-        count += 1
+    if SAFETY_ENABLED and n > MAX_SAFE_N_FACT:
+         raise ValueError(f"Safety limits prevent running O(n!) with N={n}. Max safe N is {MAX_SAFE_N_FACT}.")
+    count = math.factorial(n)
+    # Simulated work: one step per permutation, without allocating n! tuples.
+    # Still O(n!) wall-clock, so the curve stays honest when simulating.
+    if SIMULATE_FACTORIAL_WORK:
+        for _ in itertools.repeat(None, count): pass
     return count
 
 ALGORITHMS = {
@@ -113,29 +170,109 @@ ALGORITHMS = {
     "6": ("O(2^n)", exponential_time_safe),
     "7": ("O(n!)", factorial_time)
 }
+PY_ALGORITHMS = ALGORITHMS
+
+JIT_ALGORITHMS = None # Built on first use by _load_algorithms()
+
+def _load_algorithms():
+    """
+    Returns the JIT twin of ALGORITHMS, compiling it on first use.
+    Each entry is called once so no compilation or cache-load cost leaks into a measurement.
+    """
+    global JIT_ALGORITHMS
+    if JIT_ALGORITHMS is None:
+        kernels = big_o_kernels.compile_kernels()
+        linear_jit = kernels["linear"]
+        def exponential_time_jit(n): return linear_jit(_exponential_target(n))
+        JIT_ALGORITHMS = {
+            # A compiled call costs ~3x a plain Python one (Numba's dispatcher boxes and
+            # unboxes; a cfunc's ctypes entry is slower still), so O(1) stays uncompiled.
+            "1": ("O(1)", constant_time),
+            "2": ("O(log n)", pure(kernels["logarithmic"])),
+            "3": ("O(n)", pure(kernels["linear"])),
+            "4": ("O(n log n)", pure(kernels["linearithmic"])),
+            "5": ("O(n^2)", pure(kernels["quadratic"])),
+            "6": ("O(2^n)", exponential_time_jit),
+            "7": ("O(n!)", factorial_time), # itertools: not nopython-compatible
+        }
+        for _, func in JIT_ALGORITHMS.values():
+            func(1) # Pre-warm
+    return JIT_ALGORITHMS
+
+def toggle_jit():
+    global ALGORITHMS, JIT_ENABLED
+    if not NUMBA_AVAILABLE:
+        if IS_PYPY: print("\n[!] JIT mode is for CPython; PyPy already JIT-compiles the kernels.")
+        else: print("\n[!] JIT unavailable: install numba (pip install numba).")
+        return
+    JIT_ENABLED = not JIT_ENABLED
+    if JIT_ENABLED and JIT_ALGORITHMS is None:
+        print("\nCompiling kernels (cached on disk after the first run)...")
+    ALGORITHMS = _load_algorithms() if JIT_ENABLED else PY_ALGORITHMS
+    print(f"\n>> JIT kernels are now {'ON' if JIT_ENABLED else 'OFF'}.")
 
 # --- HELPER FUNCTIONS ---
 
-def measure_time(func, n):
+MIN_SAMPLE_NS = 1_000_000 # Calls faster than 1 ms are batched and averaged
+MAX_BATCH = 1_000_000
+def measure_runs(func, n):
+    """
+    Returns (seconds one func(n) call takes, calls averaged), or (None, 0) if skipped.
+    A pilot call decides whether a single reading is trustworthy; if it ran
+    under 1 ms, func is re-run in a batch sized to span ~1 ms and the per-call
+    mean is returned instead. PURE_KERNELS run that batch through timeit (gc
+    paused); with PRECISE_TIMING they use timeit's autorange, growing the batch
+    until it spans 0.2 s.
+    """
     try:
-        start = time.perf_counter()
+        pure_kernel = func in PURE_KERNELS
+        if pure_kernel and PRECISE_TIMING:
+            iters, elapsed = timeit.Timer(functools.partial(func, n)).autorange()
+            return elapsed / iters, iters
+        
+        start = time.perf_counter_ns()
         func(n)
-        return time.perf_counter() - start
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= MIN_SAMPLE_NS:
+            return elapsed * 1e-9, 1
+        
+        iters = min(MAX_BATCH, MIN_SAMPLE_NS // max(elapsed, 1))
+        if pure_kernel:
+            return timeit.Timer(functools.partial(func, n)).timeit(iters) / iters, iters
+        start = time.perf_counter_ns()
+        for _ in range(iters):
+            func(n)
+        return (time.perf_counter_ns() - start) / iters * 1e-9, iters
     except ValueError as e:
         print(f"\n[!] SKIPPED: {e}")
-        return None
     except RecursionError:
         print("\n[!] CRASH: Recursion limit reached.")
-        return None
     except KeyboardInterrupt:
         print("\n[!] ABORTED by user.")
-        return None
+    return None, 0
+
+def measure_time(func, n):
+    """Returns the seconds one func(n) call takes (see measure_runs), or None if skipped."""
+    return measure_runs(func, n)[0]
+
+# Cost of calling a function that does nothing, in ns, calibrated once at startup.
+# Any measured time this close to NOOP_NS is mostly call overhead, not work.
+NOOP_NS = min(timeit.repeat(lambda: None, number=10000, repeat=7)) / 10000 * 1e9
+NOISY_OVERHEAD = 0.30 # Flag rows where call overhead is more than 30% of the time
+
+def overhead_fraction(t):
+    """Share of a measured time t (seconds) that is plain call overhead."""
+    if not t: return 1.0
+    return min(1.0, NOOP_NS * 1e-9 / t)
+
+_BAR_CACHE = tuple("#" * i for i in range(41)) # Every default bar up to width=40, prebuilt
 
 def draw_bar(val, max_val, width=40, char="#"):
-    if max_val == 0 or val is None: return ""
-    ratio = val / max_val
-    num_chars = int(ratio * width)
-    if num_chars == 0 and val > 0: return "." 
+    if not max_val or val is None: return ""
+    # The batch maximum always gets the full width; float division can land just short
+    num_chars = width if val >= max_val else int(val / max_val * width)
+    if num_chars <= 0: return "." if val > 0 else ""
+    if char == "#" and num_chars < len(_BAR_CACHE): return _BAR_CACHE[num_chars]
     return char * num_chars
 
 def get_valid_int(prompt, min_val=0, max_val=float('inf')):
@@ -196,7 +333,7 @@ def run_batch_test(algorithms, n_range, step_through=False):
     
     global_max_time = 0.000001
     
-    header = f"{'N':<8} | {'Algorithm':<12} | {'Time (s)':<10} | {'Growth Visualization'}"
+    header = f"{'N':<8} | {'Algorithm':<12} | {'Time (s)':<10} | {'Ovh%':<5} | {'Runs':>8} | {'Growth Visualization'}"
     print(header)
     print("-" * len(header))
 
@@ -205,29 +342,38 @@ def run_batch_test(algorithms, n_range, step_through=False):
     for n in n_range:
         current_batch_times = []
         
+        # Measure every algorithm first; nothing is formatted or printed in between
         for name, func in algorithms:
-            t = measure_time(func, n)
+            t, runs = measure_runs(func, n)
             if t is not None:
                 results[name].append((n, t))
-                current_batch_times.append((name, t))
+                current_batch_times.append((name, t, runs))
                 if t > global_max_time: global_max_time = t
             else:
-                current_batch_times.append((name, None))
+                current_batch_times.append((name, None, 0))
 
         # Dynamic scaling for this batch? 
         # Or simple linear scaling based on current max makes tiny bars visible early on.
-        batch_max = max((t for _, t in current_batch_times if t is not None), default=0)
+        batch_max = max((t for _, t, _ in current_batch_times if t is not None), default=0)
         if batch_max == 0: batch_max = 0.000001
         
-        for name, t in current_batch_times:
+        # Rows for this N are collected and written in one go
+        out_lines = []
+        for name, t, runs in current_batch_times:
             if t is None:
                 bar = "SKIPPED"
                 t_str = "---"
+                ovh_str = "---"
+                runs_str = "---"
             else:
                 bar = draw_bar(t, batch_max, width=25)
                 t_str = f"{t:.6f}"
+                ovh = overhead_fraction(t)
+                ovh_str = f"{100 * ovh:.0f}%"
+                runs_str = f"x{runs}"
+                if ovh > NOISY_OVERHEAD: bar += " [!] noisy"
             
-            print(f"{n:<8} | {name:<12} | {t_str:<10} | {bar}")
+            out_lines.append(f"{n:<8} | {name:<12} | {t_str:<10} | {ovh_str:<5} | {runs_str:>8} | {bar}")
             
             # Step-through analysis
             if step_through and t is not None:
@@ -235,12 +381,14 @@ def run_batch_test(algorithms, n_range, step_through=False):
                 if prev is not None and prev > 0:
                     growth = t / prev
                     if growth > 1.2:
-                        print(f"       > {name} grew {growth:.1f}x")
+                        out_lines.append(f"       > {name} grew {growth:.1f}x")
         
-        print("-" * len(header))
+        out_lines.append("-" * len(header))
+        sys.stdout.write("\n".join(out_lines) + "\n")
+        sys.stdout.flush()
         
         # Update prev times
-        for name, t in current_batch_times:
+        for name, t, _ in current_batch_times:
              if t is not None: prev_times[name] = t
              
         if step_through:
@@ -316,30 +464,36 @@ def run_curses_mode():
         max_y, max_x = stdscr.getmaxyx()
         
         while True:
-            stdscr.clear()
-            stdscr.addstr(0, 0, "Big O Curses Viz (Press 'n' for next step, 'q' to quit)", curses.A_BOLD)
-            
-            row = 2
             max_time_in_step = 0
             results = []
             
+            # measure_time batches each reading, so sub-microsecond jitter doesn't
+            # make the bars flicker between frames
             for name, func in demo_algs:
                 t = measure_time(func, n)
                 if t is None: t = 0
                 results.append((name, t))
                 if t > max_time_in_step: max_time_in_step = t
             
+            # Text goes out as one buffer; only the coloured bars need their own calls
+            lines = ["Big O Curses Viz (Press 'n' for next step, 'q' to quit)", ""]
+            bars = []
             for name, t in results:
                 bar_len = int((t / (max_time_in_step + 0.00001)) * (max_x - 30))
                 color = curses.color_pair(1)
                 if t > 0.05: color = curses.color_pair(2)
                 if t > 0.5: color = curses.color_pair(3)
                 
-                stdscr.addstr(row, 0, f"{name:<10} | {t:.5f}s | ", curses.A_NORMAL)
+                bars.append((len(lines), bar_len, color))
+                lines.append(f"{name:<10} | {t:.5f}s | ")
+                lines.append("")
+            lines.extend(["", "", f"Current N: {n}"])
+            
+            stdscr.erase()
+            stdscr.addstr(0, 0, "\n".join(lines))
+            stdscr.chgat(0, 0, len(lines[0]), curses.A_BOLD)
+            for row, bar_len, color in bars:
                 stdscr.addstr(row, 25, "#" * bar_len, color)
-                row += 2
-                
-            stdscr.addstr(row+2, 0, f"Current N: {n}")
             stdscr.refresh()
             
             key = stdscr.getch()
@@ -351,6 +505,64 @@ def run_curses_mode():
     
     curses.wrapper(curses_main)
 
+def nearest_exponent(slope):
+    # Half-up rather than round()'s half-to-even, so 0.5/1.5/2.5 all move up a class
+    return max(0, math.floor(slope + 0.5))
+
+def classify(slope):
+    """Maps a log-log slope to the nearest polynomial class: 0 -> O(1), 1 -> O(n), 2 -> O(n^2)..."""
+    k = nearest_exponent(slope)
+    if k == 0: return "O(1)"
+    if k == 1: return "O(n)"
+    return f"O(n^{k})"
+
+def expected_exponent(guess):
+    """
+    The log-log slope a Big-O guess should fit to, or None if it isn't polynomial.
+    Log factors barely move the slope, so O(log n) expects 0 and O(n log n) expects 1.
+    """
+    term = guess.replace(" ", "").lower()
+    if term.startswith("o(") and term.endswith(")"): term = term[2:-1]
+    if term.endswith("logn"): term = term[:-4] or "1"
+    if term == "1": return 0
+    if term == "n": return 1
+    if term.startswith("n^") and term[2:].isdigit(): return int(term[2:])
+    return None
+
+def run_statistical_fit(func, n_range):
+    """
+    Fits log(time) = slope * log(N) + c over n_range by least squares and prints
+    the fitted exponent. Returns the slope, or None if too few points ran.
+    Logarithmic factors only nudge the slope: O(log n) fits near 0, O(n log n) near 1.
+    """
+    points = []
+    for n in n_range:
+        t = measure_time(func, n)
+        if t and n > 0:
+            points.append((math.log(n), math.log(t)))
+    if len(points) < 2 or len({x for x, _ in points}) < 2:
+        print("[!] Not enough measurable points to fit a curve.")
+        return None
+    
+    count = len(points)
+    mean_x = sum(x for x, _ in points) / count
+    mean_y = sum(y for _, y in points) / count
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    slope = sxy / sxx
+    
+    print(f"Fitted exponent: {slope:.2f} -> nearest class: {classify(slope)}")
+    return slope
+
+def print_runtime_hint():
+    """Reports which interpreter/accelerators are in use and what would speed the kernels up."""
+    print(f"Interpreter: {sys.implementation.name} {sys.version.split()[0]}")
+    print(f"numpy kernels: {'ON' if NUMPY_AVAILABLE else 'OFF'} | numba JIT: {'available' if NUMBA_AVAILABLE else 'unavailable'}")
+    if IS_PYPY:
+        print("Detected PyPy - using pure-Python kernels for best throughput.")
+    elif not NUMBA_AVAILABLE:
+        print("Hint: the counting loops run 10-50x faster under PyPy, or with numba installed (menu option 9).")
+
 def print_final_summary(results):
     if not results: return
     print("\n\n" + "="*50)
@@ -396,7 +608,8 @@ def main_menu():
         print("\n" + "="*40)
         print(" BIG O SANDBOX - MAIN MENU")
         print("="*40)
-        print(f"Safety Limits: {'ON' if CONFIG['safety_enabled'] else 'OFF (Dangerous)'}")
+        print(f"Safety Limits: {'ON' if SAFETY_ENABLED else 'OFF (Dangerous)'}")
+        print(f"JIT Kernels: {'ON' if JIT_ENABLED else 'OFF'}{'' if NUMBA_AVAILABLE else ' (numba not installed)'}")
         print("1. Quick Standard Test (Automated)")
         print("2. Custom Batch Test (Select Algs & Range)")
         print("3. Comparison Mode (A vs B)")
@@ -405,7 +618,9 @@ def main_menu():
         print("6. Curses Visualization Mode")
         print("7. Explain Big-O Definitions")
         print("8. Run Custom User Function")
-        print("9. Exit")
+        print("9. Toggle JIT Kernels (Numba)")
+        print("10. Statistical Fit (Log-Log Slope)")
+        print("11. Exit")
         
         choice = input("\nSelect option: ").strip()
         
@@ -430,8 +645,7 @@ def main_menu():
             run_batch_test(algs, rng, step_through=True)
             
         elif choice == '5':
-            CONFIG["safety_enabled"] = not CONFIG["safety_enabled"]
-            print(f"\n>> Safety is now {'ON' if CONFIG['safety_enabled'] else 'OFF'}.")
+            toggle_safety()
             
         elif choice == '6':
             run_curses_mode()
@@ -456,8 +670,29 @@ def main_menu():
                 ratio_str = f"{(t/prev):.2f}x" if prev and prev > 0 else "-"
                 print(f"{n:<10} | {t:.5f}s   | {ratio_str}")
                 prev = t
+            
+            print("\nFitting over a wider range...")
+            slope = run_statistical_fit(custom_user_function, [1000, 2000, 4000, 8000, 16000, 32000])
+            expected = expected_exponent(USER_GUESS)
+            if slope is None:
+                pass
+            elif expected is None:
+                print(f"Your guess: {USER_GUESS} -> not polynomial; a log-log fit can't decide it.")
+            else:
+                verdict = "PASS" if nearest_exponent(slope) == expected else "FAIL"
+                print(f"Your guess: {USER_GUESS} (exponent {expected}) -> {verdict}")
                 
         elif choice == '9':
+            toggle_jit()
+            
+        elif choice == '10':
+            algs = select_algorithms()
+            rng = configure_range()
+            for name, func in algs:
+                print(f"\n{name}:")
+                run_statistical_fit(func, rng)
+            
+        elif choice == '11':
             print("Exiting.")
             sys.exit(0)
             
@@ -469,11 +704,28 @@ if __name__ == "__main__":
     if "--curses" in sys.argv:
         run_curses_mode()
         sys.exit(0)
+    elif "--precompile" in sys.argv:
+        # Warm Numba's on-disk cache so later JIT sessions start instantly
+        if not NUMBA_AVAILABLE:
+            print("[!] --precompile needs numba (pip install numba).")
+            sys.exit(1)
+        _load_algorithms()
+        print("JIT kernels compiled and cached.")
+        sys.exit(0)
     elif "--explain" in sys.argv:
         print("\n=== DEFINITIONS ===")
         for k, v in EXPLANATIONS.items():
              print(f"{k:<10}: {v}")
         sys.exit(0)
+    elif "--pypy-check" in sys.argv:
+        print_runtime_hint()
+        sys.exit(0)
+    
+    if "--precise" in sys.argv:
+        PRECISE_TIMING = True
+        print("Precise timing ON: each kernel reading takes at least 0.2 s.")
+    if IS_PYPY:
+        print("Detected PyPy - using pure-Python kernels for best throughput.")
     
     try:
         main_menu()
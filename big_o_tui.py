@@ -7,6 +7,9 @@ from textual_plotext import PlotextPlot
 import time
 import sys
 import os
+import asyncio
+import array
+import multiprocessing
 
 # Import logic from our existing sandbox
 # Ensure big_o_sandbox is in the path or same directory
@@ -17,6 +20,31 @@ except ImportError:
     sys.path.append(os.getcwd())
     import big_o_sandbox
 
+def _quiet_worker():
+    """Pool initializer: measure_time's console messages would draw over the TUI."""
+    sys.stdout = open(os.devnull, "w")
+
+def _new_pool():
+    # multiprocessing.Pool rather than ProcessPoolExecutor: only Pool can
+    # terminate() a worker that is still mid-measurement
+    return multiprocessing.Pool(os.cpu_count(), initializer=_quiet_worker)
+
+def _pool_measure(pool, loop, func, n):
+    """Runs big_o_sandbox.measure_time(func, n) in pool and returns an awaitable for it."""
+    future = loop.create_future()
+    
+    def resolve(setter, value):
+        # The future may already be cancelled by a newer run; drop late results
+        if not future.done():
+            setter(value)
+    
+    pool.apply_async(
+        big_o_sandbox.measure_time, (func, n),
+        callback=lambda t: loop.call_soon_threadsafe(resolve, future.set_result, t),
+        error_callback=lambda e: loop.call_soon_threadsafe(resolve, future.set_exception, e),
+    )
+    return future
+
 class BigOTUI(App):
     CSS = """
     Screen {
@@ -67,6 +95,18 @@ class BigOTUI(App):
 
     TITLE = "Big O Visualizer (TUI)"
     SUB_TITLE = "Powered by Textual & Plotext"
+    PLOT_UPDATE_INTERVAL = 0.1 # Min seconds between partial redraws during a run
+
+    def __init__(self):
+        super().__init__()
+        # Measurements run in worker processes: the CPU-bound kernels hold the GIL,
+        # which would otherwise freeze the event loop until a run finishes.
+        self._pool = _new_pool()
+        self._run = None # Worker running compute_and_plot, if any
+
+    def on_unmount(self) -> None:
+        # Kills any measurement still running, so quitting never waits on one
+        self._pool.terminate()
 
     def compose(self) -> ComposeResult:
         # Sidebar for controls
@@ -147,48 +187,82 @@ class BigOTUI(App):
             
         # Prepare Data
         # Map keys back to (name, function)
-        selected_algs = [big_o_sandbox.ALGORITHMS[k] for k in selected_keys]
+        selected_algs = tuple(big_o_sandbox.ALGORITHMS[k] for k in selected_keys)
         
         log.write_line(f"Running test: N=[{start_n}..{end_n}], Step={step_n}")
         log.write_line(f"Algorithms: {[a[0] for a in selected_algs]}")
         
+        # Materialize N once as C longs; it doubles as the plot's x axis
+        n_values = array.array('l', range(start_n, end_n + 1, step_n))
+        
+        # A run still in flight is cancelled by the exclusive worker below; its
+        # measurements would keep the pool busy ahead of this run, so kill them
+        if self._run is not None and not self._run.is_finished:
+            self._pool.terminate()
+            self._pool = _new_pool()
+        
         # Run in worker to avoid freezing UI
-        self.run_worker(self.compute_and_plot(selected_algs, range(start_n, end_n + 1, step_n)), exclusive=True)
+        self._run = self.run_worker(self.compute_and_plot(selected_algs, n_values), exclusive=True)
 
-    async def compute_and_plot(self, algorithms, n_range):
+    async def compute_and_plot(self, algorithms, n_values):
         plot_widget = self.query_one("#plot-widget", PlotextPlot)
         log = self.query_one("#log-widget", Log)
         
         # We need to gather data to plot lines: X axis = N, Y axis = Time
-        # data_store = { "O(1)": [t1, t2...], "O(n)": [t1, t2...] }
-        x_axis = list(n_range)
-        data_store = {alg[0]: [] for alg in algorithms}
+        # data_store = { "O(1)": array('d', [t1, t2...]), ... }: plain C doubles,
+        # so plotext doesn't coerce element by element
+        x_axis = n_values
+        data_store = {alg[0]: array.array('d') for alg in algorithms}
+        # A 0.0 reading can't sit on a log axis; pin it to one no-op call
+        floor_t = big_o_sandbox.NOOP_NS * 1e-9
         
         plot_widget.plt.clear_data()
         plot_widget.plt.title("Runtime Complexity")
         plot_widget.plt.xlabel("Input Size (N)")
-        plot_widget.plt.ylabel("Time (seconds)")
+        plot_widget.plt.ylabel("Time (seconds, log)")
+        # Log scale: on a linear axis O(n^2) squashes O(log n) flat against zero
+        plot_widget.plt.yscale("log")
         
-        # Computation loop
-        for n in n_range:
-            for name, func in algorithms:
-                t = big_o_sandbox.measure_time(func, n)
-                if t is None: t = 0
-                data_store[name].append(t)
+        # Computation loop: each N's algorithms run in parallel in the pool
+        # Bound to names once, so the loop does no attribute lookups (the generator
+        # below reads them as closure cells). run_comparison already passes a tuple.
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+        last_update = time.monotonic()
+        for n in n_values:
+            if not algorithms:
+                break
+            times = await asyncio.gather(
+                *(_pool_measure(pool, loop, func, n) for _, func in algorithms)
+            )
+            for (name, _), t in zip(algorithms, times):
+                if t is not None:
+                    data_store[name].append(t if t > 0 else floor_t)
+            # A skipped point (safety limit) ends its series: every larger N would be skipped too
+            if None in times:
+                algorithms = tuple(alg for alg, t in zip(algorithms, times) if t is not None)
             
-            # Optional: Intermediate log
-            # log.write_line(f"Finished N={n}...")
-            # We could do partial updates here if plotext supports it easily, 
-            # but usually it's cleaner to plot at end or in chunks.
+            # Stream partial results, throttled so redraws don't dominate the run.
+            # This coroutine runs on the event loop itself, so we draw directly.
+            now = time.monotonic()
+            if now - last_update >= self.PLOT_UPDATE_INTERVAL:
+                self.draw_plot(plot_widget, x_axis, data_store)
+                log.write_line(f"N={n} done")
+                last_update = now
             
-        # Plotting
-        for name, times in data_store.items():
-            plot_widget.plt.plot(x_axis, times, label=name)
-        
-        plot_widget.refresh()
+        self.draw_plot(plot_widget, x_axis, data_store)
         log.write_line("Test Complete. Graph updated.")
         self.notify("Comparison Complete")
 
+    def draw_plot(self, plot_widget, x_axis, data_store):
+        """Replots every series measured so far: one plot() call per algorithm, one refresh."""
+        plot_widget.plt.clear_data()
+        for name, times in data_store.items():
+            if not times:
+                continue
+            plot_widget.plt.plot(x_axis[:len(times)], times, label=name)
+        plot_widget.refresh()
+
 if __name__ == "__main__":
     app = BigOTUI()
     app.run()